@@ -310,18 +310,16 @@ class ToolNodes:
                     },
                 }
 
-            # Filter unknown artists
-            unknown = [
-                t
-                for t in candidates
-                if (t.get("artist") if isinstance(t, dict) else t.artist) not in known
-            ]
-
-            # Select top 5 (prioritize unknown, but include known if needed)
-            if len(unknown) >= 5:
-                final = unknown[:5]
-            else:
-                final = unknown + candidates[: 5 - len(unknown)]
+            # Split candidates by artist familiarity (set lookup, single pass)
+            known_set = set(known)
+            unknown = []
+            familiar = []
+            for t in candidates:
+                artist = t.get("artist") if isinstance(t, dict) else t.artist
+                (familiar if artist in known_set else unknown).append(t)
+
+            # Select top 5 (prioritize unknown, top up with known artists if needed)
+            final = (unknown + familiar)[:5]
 
             # Handle case where we still have no tracks
             if len(final) == 0:
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from api.core.config import settings
+
+
+class TTLCache:
+    """Small in-process cache: entries expire after `ttl` seconds, LRU-evicted past `maxsize`."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value, or await `loader()` to fill it.
+        Concurrent misses on the same key share a single load.
+        Errors and None results are not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._finish_load(key, done))
+        # Shielded, so one cancelled caller does not abort the load for the others
+        return await asyncio.shield(task)
+
+    def _finish_load(self, key: Hashable, task: asyncio.Future) -> None:
+        self._pending.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        # None reads as a miss in get(), so there is nothing worth storing
+        if task.result() is not None:
+            self.set(key, task.result())
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Authenticated users by email (token subject), shared by all requests of a worker
+user_cache = TTLCache(ttl=settings.AUTH_USER_CACHE_TTL)
+
+# CLAP text embeddings by query digest: popular searches skip the inference service
+text_embedding_cache = TTLCache(ttl=settings.TEXT_EMBEDDING_CACHE_TTL)
+
+# Track metadata (no embeddings) by track id, for the similarity and streaming lookups
+# only (LibraryRepository.get_cached_track); the public track endpoint reads the DB
+track_cache = TTLCache(ttl=settings.TRACK_CACHE_TTL, maxsize=4096)
+
+# Audio object sizes by MinIO path: objects are immutable, so streams skip the HEAD
+audio_size_cache = TTLCache(ttl=settings.AUDIO_SIZE_CACHE_TTL, maxsize=8192)
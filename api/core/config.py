@@ -31,6 +31,17 @@ class DatabaseSettings(BaseSettings):
     DATABASE_URL: Optional[str] = None
     ENABLE_DOCS: bool = False
 
+    # asyncpg pool tuning
+    DB_POOL_MIN_SIZE: int = 2  # Keep warm connections (and their statement caches)
+    DB_POOL_MAX_SIZE: int = 20
+    # Prepared statements kept per connection (asyncpg's default)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_MAX_INACTIVE_CONNECTION_LIFETIME: float = 300.0  # Seconds before idle close
+
+    # pgvector wire format: text '[x,y,...]', or binary float4 buffers. Binary is
+    # cheaper to decode, but float4 values widen to long float64 reprs in responses
+    VECTOR_BINARY_CODEC: bool = False
+
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
     def assemble_db_connection(cls, url_from_dotenv, info: ValidationInfo):
@@ -43,7 +54,7 @@ class DatabaseSettings(BaseSettings):
         port = info.data.get("POSTGRES_PORT")
         db = info.data.get("POSTGRES_DB")
 
-        if all([user, password, host, port, db]):
+        if user and password and host and port and db:
             return f"postgresql://{user}:{password}@{host}:{port}/{db}"
 
         raise ValueError(
@@ -64,6 +75,11 @@ class AuthSettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str = "HS256"
+    BCRYPT_ROUNDS: int = 12  # Work factor for new password hashes
+    # Seconds an authenticated user lookup is reused across requests (0 disables)
+    AUTH_USER_CACHE_TTL: int = 30
+    # Seconds a just-rotated refresh token can still be replayed by a parallel refresh
+    REFRESH_TOKEN_GRACE_SECONDS: int = 10
 
 
 class BusinessRulesSettings(BaseSettings):
@@ -77,6 +93,12 @@ class BusinessRulesSettings(BaseSettings):
     SIMILAR_TRACKS_LIMIT: int = 40
     SIMILAR_TRACKS_RETURNED: int = 10
 
+    # Seconds similarity and streaming reuse a track lookup per worker (0 disables)
+    TRACK_CACHE_TTL: int = 600
+
+    # Seconds the discovery centroids (and steering axes built from them) are reused
+    DISCOVERY_CENTROIDS_TTL: int = 3600
+
     # API query limits (max values users can request)
     MAX_ARTIST_LIMIT: int = 500
     MAX_POINTS_LIMIT: int = 5000
@@ -89,11 +111,27 @@ class BusinessRulesSettings(BaseSettings):
     DEFAULT_SEARCH_LIMIT: int = 50
     DEFAULT_NEIGHBORS_LIMIT: int = 20
 
-    AUDIO_STREAM_CHUNK_SIZE: int = 32 * 1024  # 32KB
+    # Seconds the point-cloud row counts are reused for pagination totals (0 disables)
+    COORDINATES_COUNT_CACHE_TTL: int = 60
+
+    # Bytes read from MinIO per streamed chunk (bigger chunks, fewer reads and sends)
+    AUDIO_STREAM_CHUNK_SIZE: int = 256 * 1024  # 256KB
+    # Seconds an audio object's size (MinIO HEAD) is reused per worker (0 disables)
+    AUDIO_SIZE_CACHE_TTL: int = 3600
 
     # Inference service timeout (in seconds)
     # Cold start with model loading can take 3-5 minutes, warm requests are usually < 5s
     INFERENCE_TIMEOUT: int = 360
+    # Total seconds for all embedding attempts and backoff: one cold start plus quick
+    # warm retries, well under max_retries full timeouts
+    INFERENCE_RETRY_BUDGET: int = 420
+    # Shared outbound HTTP client pool (inference calls): idle connections kept for reuse
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 50
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
+    # Seconds a text embedding is reused for identical discovery queries (0 disables)
+    TEXT_EMBEDDING_CACHE_TTL: int = 300
 
 
 class ExternalAPISettings(BaseSettings):
@@ -125,7 +163,7 @@ class ExternalAPISettings(BaseSettings):
 
 
 class CORSSettings(BaseSettings):
-    CORS_ORIGINS: list[str] = [
+    CORS_ORIGINS: tuple[str, ...] = (
         "http://localhost:5173",
         "http://127.0.0.1:5173",
         "http://localhost:5174",
@@ -134,7 +172,7 @@ class CORSSettings(BaseSettings):
         "http://msv2-webapp.192.168.1.20.nip.io",
         "https://webapp.msv2.ovh",
         "https://www.webapp.msv2.ovh",
-    ]
+    )
 
 
 # ----------------------------------------------- #
@@ -150,7 +188,7 @@ class Settings(
     BaseSettings,
 ):
     model_config = SettingsConfigDict(
-        env_file=".env", extra="ignore", case_sensitive=True
+        env_file=".env", extra="ignore", case_sensitive=True, frozen=True
     )
 
 
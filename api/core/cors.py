@@ -7,7 +7,7 @@ from api.core.config import settings
 def add_cors_middleware(app: FastAPI):
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
+        allow_origins=frozenset(settings.CORS_ORIGINS),  # O(1) origin lookups
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -1,7 +1,13 @@
-import ast
-import math
+import struct
 
 import asyncpg
+import numpy as np
+
+from api.core.config import settings
+
+# pgvector binary wire format: uint16 dim, uint16 unused, then dim big-endian float4
+_VECTOR_HEADER = struct.Struct(">HH")
+_VECTOR_DTYPE = np.dtype(">f4")
 
 
 def decode_vector(value: str | list | None) -> list[float] | None:
@@ -20,30 +26,49 @@ def decode_vector(value: str | list | None) -> list[float] | None:
     if not value:
         return None
 
+    # pgvector text format is always '[x,y,...]': slice the brackets and let
+    # numpy scan the numbers in C, rather than building a Python AST per row
+    if value[0] != "[" or value[-1] != "]":
+        return None
     try:
-        return ast.literal_eval(value)
-    except (ValueError, SyntaxError):
+        return np.fromstring(value[1:-1], dtype=np.float64, sep=",").tolist()
+    except ValueError:
         return None
 
 
-def encode_vector(value: list[float] | None) -> str | None:
-    """Encodes a list of floats into pgvector string."""
+def encode_vector(value: list[float] | np.ndarray | None) -> str | None:
+    """Encodes a list of floats (or numpy array) into pgvector string."""
     if value is None:
         return None
     return f"[{','.join(map(str, value))}]"
 
 
+def decode_vector_binary(data: bytes) -> list[float]:
+    """Decodes pgvector binary data into a list of floats."""
+    dim, _ = _VECTOR_HEADER.unpack_from(data)
+    return np.frombuffer(
+        data, dtype=_VECTOR_DTYPE, count=dim, offset=_VECTOR_HEADER.size
+    ).tolist()
+
+
+def encode_vector_binary(value: list[float] | np.ndarray) -> bytes:
+    """Encodes a list of floats (or numpy array) into pgvector binary data."""
+    arr = np.asarray(value, dtype=_VECTOR_DTYPE)
+    return _VECTOR_HEADER.pack(arr.size, 0) + arr.tobytes()
+
+
 def normalize_vector(v: list[float]) -> list[float]:
     """
     Returns the normalized unit vector (length = 1).
     If the vector is zero-length, returns it as is (or could raise error).
     """
-    if not v:
+    if len(v) == 0:
         return []
-    norm = math.sqrt(sum(x * x for x in v))
+    arr = np.asarray(v, dtype=np.float64)
+    norm = np.linalg.norm(arr)
     if norm == 0:
         return v
-    return [x / norm for x in v]
+    return (arr / norm).tolist()
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -51,21 +76,33 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     Calculates cosine similarity between two vectors.
     Range: [-1, 1]. 1 = identical direction.
     """
-    if not a or not b or len(a) != len(b):
+    if len(a) == 0 or len(b) == 0 or len(a) != len(b):
         return 0.0
 
-    dot_product = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(y * y for y in b))
+    va = np.asarray(a, dtype=np.float64)
+    vb = np.asarray(b, dtype=np.float64)
+    norm_a = np.linalg.norm(va)
+    norm_b = np.linalg.norm(vb)
 
     if norm_a == 0 or norm_b == 0:
         return 0.0
 
-    return dot_product / (norm_a * norm_b)
+    return float(va @ vb / (norm_a * norm_b))
 
 
 async def register_vector_codec(conn: asyncpg.Connection):
     """Register custom codec for 'vector' type with asyncpg."""
+    if settings.VECTOR_BINARY_CODEC:
+        # Raw float4 buffers: no number formatting on the server, no parsing here
+        await conn.set_type_codec(
+            "vector",
+            encoder=encode_vector_binary,
+            decoder=decode_vector_binary,
+            schema="public",
+            format="binary",
+        )
+        return
+
     await conn.set_type_codec(
         "vector",
         encoder=encode_vector,
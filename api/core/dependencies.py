@@ -5,7 +5,6 @@ from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from minio import Minio
 
-from api.core.config import settings
 from api.core.security import validate_token_and_get_user
 from api.models.auth import UserInDB
 from api.models.requests import (
@@ -35,49 +34,40 @@ def get_minio_client(request: Request) -> Minio:
     return request.app.state.minio_client
 
 
-def get_auth_repository(pool: asyncpg.Pool = Depends(get_db_pool)) -> AuthRepository:
-    return AuthRepository(pool)
+# Repositories are stateless wrappers built once in the lifespan (see startup_repositories)
 
 
-def get_library_repository(
-    pool: asyncpg.Pool = Depends(get_db_pool),
-) -> LibraryRepository:
-    return LibraryRepository(pool)
+def get_auth_repository(request: Request) -> AuthRepository:
+    return request.app.state.auth_repo
 
 
-def get_favorites_repository(
-    pool: asyncpg.Pool = Depends(get_db_pool),
-) -> FavoritesRepository:
-    return FavoritesRepository(pool)
+def get_library_repository(request: Request) -> LibraryRepository:
+    return request.app.state.library_repo
 
 
-def get_playlists_repository(
-    pool: asyncpg.Pool = Depends(get_db_pool),
-) -> PlaylistsRepository:
-    return PlaylistsRepository(pool)
+def get_favorites_repository(request: Request) -> FavoritesRepository:
+    return request.app.state.favorites_repo
 
 
-def get_coordinates_repository(
-    pool: asyncpg.Pool = Depends(get_db_pool),
-) -> CoordinatesRepository:
-    return CoordinatesRepository(pool)
+def get_playlists_repository(request: Request) -> PlaylistsRepository:
+    return request.app.state.playlists_repo
 
 
-def get_discovery_repository(
-    pool: asyncpg.Pool = Depends(get_db_pool),
-) -> DiscoveryRepository:
-    return DiscoveryRepository(pool)
+def get_coordinates_repository(request: Request) -> CoordinatesRepository:
+    return request.app.state.coordinates_repo
 
 
-def get_media_repository(
-    minio_client: Minio = Depends(get_minio_client),
-) -> MediaRepository:
-    return MediaRepository(minio_client)
+def get_discovery_repository(request: Request) -> DiscoveryRepository:
+    return request.app.state.discovery_repo
 
 
-def get_inference_repository() -> InferenceRepository:
+def get_media_repository(request: Request) -> MediaRepository:
+    return request.app.state.media_repo
+
+
+def get_inference_repository(request: Request) -> InferenceRepository:
     """Get InferenceRepository instance."""
-    return InferenceRepository(timeout=settings.INFERENCE_TIMEOUT)
+    return request.app.state.inference_repo
 
 
 async def get_current_user(
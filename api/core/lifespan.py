@@ -1,12 +1,21 @@
 from contextlib import asynccontextmanager
 
 import asyncpg
+import httpx
 from fastapi import FastAPI
 from minio import Minio
 
 from api.core.config import settings
 from api.core.db_codecs import register_vector_codec
 from api.core.logger import logger
+from api.repositories.auth import AuthRepository
+from api.repositories.coordinates import CoordinatesRepository
+from api.repositories.discovery import DiscoveryRepository
+from api.repositories.favorites import FavoritesRepository
+from api.repositories.inference import InferenceRepository
+from api.repositories.library import LibraryRepository
+from api.repositories.media import MediaRepository
+from api.repositories.playlists import PlaylistsRepository
 
 
 async def startup_database_pool(app: FastAPI):
@@ -14,8 +23,12 @@ async def startup_database_pool(app: FastAPI):
     pool = await asyncpg.create_pool(
         settings.DATABASE_URL,
         init=register_vector_codec,
-        min_size=1,  # Reduced for local dev stability
-        max_size=20,
+        min_size=settings.DB_POOL_MIN_SIZE,
+        max_size=settings.DB_POOL_MAX_SIZE,
+        statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+        max_inactive_connection_lifetime=settings.DB_MAX_INACTIVE_CONNECTION_LIFETIME,
+        # Short OLTP / vector queries: LLVM JIT compile time outweighs any gain
+        server_settings={"jit": "off"},
         command_timeout=60,  # Increased for slow queries
         timeout=10,  # Increased connection timeout
     )
@@ -23,7 +36,10 @@ async def startup_database_pool(app: FastAPI):
         raise Exception("Could not connect to the database")
 
     app.state.db_pool = pool
-    logger.info("Asyncpg Pool Connected (with vector codec, min=5, max=20)")
+    logger.info(
+        f"Asyncpg Pool Connected (with vector codec, "
+        f"min={settings.DB_POOL_MIN_SIZE}, max={settings.DB_POOL_MAX_SIZE})"
+    )
 
 
 def startup_minio_client(app: FastAPI):
@@ -49,16 +65,48 @@ def startup_minio_client(app: FastAPI):
     app.state.minio_client = minio_client
 
 
+def startup_http_client(app: FastAPI):
+    """Initialize the shared outbound HTTP client (keeps connections alive)."""
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+    )
+    logger.info("HTTP Client Ready")
+
+
+def startup_repositories(app: FastAPI):
+    """Build the stateless repositories once, shared by every request."""
+    pool = app.state.db_pool
+    app.state.auth_repo = AuthRepository(pool)
+    app.state.library_repo = LibraryRepository(pool)
+    app.state.favorites_repo = FavoritesRepository(pool)
+    app.state.playlists_repo = PlaylistsRepository(pool)
+    app.state.coordinates_repo = CoordinatesRepository(pool)
+    app.state.discovery_repo = DiscoveryRepository(pool)
+    app.state.media_repo = MediaRepository(app.state.minio_client)
+    app.state.inference_repo = InferenceRepository(
+        app.state.http_client, timeout=settings.INFERENCE_TIMEOUT
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await startup_database_pool(app)
     startup_minio_client(app)
+    startup_http_client(app)
+    startup_repositories(app)
 
     yield
 
     # Shutdown
     await app.state.db_pool.close()
     logger.info("Asyncpg Pool Disconnected")
+    await app.state.http_client.aclose()
+    logger.info("HTTP Client Closed")
     # Database pool = persistent connections → must close
+    # HTTP client = pooled keep-alive connections → must close
     # MinIO client = on-demand HTTP requests → auto-cleanup
@@ -1,14 +1,30 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-    force=True,
+# Request code only enqueues records; a background thread formats and writes to stdout
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
 
-logger = logging.getLogger("uvicorn")
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler], force=True)
+
+_listener = QueueListener(_log_queue, _stdout_handler)
+_listener.start()
+atexit.register(_listener.stop)  # Flush pending records on shutdown
+
+# The app's own logger propagates to the root queue handler. uvicorn's logging
+# config gives the "uvicorn" logger a synchronous handler and propagate=False,
+# so logging through it would bypass the queue.
+logger = logging.getLogger("api")
 
 
 # ----------------------------------------------- #
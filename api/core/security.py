@@ -1,3 +1,7 @@
+import base64
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -5,10 +9,29 @@ import bcrypt
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 
+from api.core.caches import user_cache
 from api.core.config import settings
-from api.models.auth import TokenData, UserInDB
+from api.models.auth import UserInDB
 from api.repositories.auth import AuthRepository
 
+# Token lifetimes (settings are frozen, so these never go stale)
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_TOKEN_EXPIRE = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+# Our tokens are a few hundred bytes; anything far larger is garbage
+_MAX_TOKEN_LENGTH = 4096
+
+_CREDENTIALS_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _credentials_exception() -> HTTPException:
+    """Build the 401 raised for any invalid token (only on the failure path)."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers=_CREDENTIALS_HEADERS,
+    )
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
@@ -20,20 +43,31 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     """Hash a password for storing."""
     pwd_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(pwd_bytes, salt).decode("utf-8")
 
 
+# Throwaway hash with the configured cost, for unknown users. Built at import so
+# the first failed login doesn't also pay for hashing it.
+_DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(16))
+
+
+def verify_user_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a login password, doing the same bcrypt work when the user does not exist.
+    Keeps response time from revealing whether an email is registered.
+    """
+    if hashed_password is None:
+        verify_password(plain_password, _DUMMY_PASSWORD_HASH)
+        return False
+    return verify_password(plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    to_encode.update({"exp": int(expire.timestamp())})
+    expire = datetime.now(timezone.utc) + (expires_delta or ACCESS_TOKEN_EXPIRE)
+    # Single allocation; the caller's dict is left untouched
+    to_encode = {**data, "exp": int(expire.timestamp())}
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
@@ -42,22 +76,31 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT refresh token."""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
-    to_encode.update({"exp": int(expire.timestamp())})
+    expire = datetime.now(timezone.utc) + (expires_delta or REFRESH_TOKEN_EXPIRE)
+    # Single allocation; the caller's dict is left untouched
+    to_encode = {**data, "exp": int(expire.timestamp())}
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
 
 
+def next_refresh_jti(jti: str) -> str:
+    """
+    Derive the JTI that replaces `jti` on refresh.
+    Deterministic, so parallel refreshes of the same token agree on the successor.
+    """
+    digest = hmac.new(
+        settings.SECRET_KEY.encode("utf-8"), jti.encode("utf-8"), hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(digest[:16]).rstrip(b"=").decode("ascii")
+
+
 def decode_jwt(token: str) -> Optional[dict]:
     """Decode a JWT token and return the payload."""
+    # Cheap structural checks before any base64/JSON/HMAC work
+    if not token or len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
+        return None
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -82,60 +125,48 @@ async def validate_token_and_get_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    # Decode token
-    try:
-        payload = decode_jwt(token)
-        if payload is None:
-            raise credentials_exception
-        token_data = TokenData(**payload)
-    except JWTError:
-        raise credentials_exception
+    # Decode token (signature and expiry verified by decode_jwt)
+    payload = decode_jwt(token)
+    if payload is None:
+        raise _credentials_exception()
 
     # Validate token has subject (email)
-    if token_data.sub is None:
-        raise credentials_exception
+    sub = payload.get("sub")
+    if sub is None:
+        raise _credentials_exception()
 
-    # Get user from database
-    user = await auth_repo.get_user_by_email(token_data.sub)
+    # Get user from cache, falling back to the database
+    user = user_cache.get(sub)
     if user is None:
-        raise credentials_exception
+        user = await auth_repo.get_user_by_email(sub)
+        if user is None:
+            raise _credentials_exception()
+        user_cache.set(sub, user)
 
     # -------------------------------------------------------------------------
-    # JTI VALIDATION DISABLED FOR ACCESS TOKENS (RACE CONDITION FIX)
+    # JTI VALIDATION DISABLED FOR ACCESS TOKENS
     # -------------------------------------------------------------------------
-    # We disable strict JTI checks for Access Tokens to handle parallel requests.
+    # Access tokens are short-lived (15m) and are not checked against User.JTI,
+    # so a token issued just before a rotation keeps working until it expires.
+    #
+    # Refresh tokens ARE checked, atomically, in `refresh_token_handler`:
     #
     # 1. Frontend makes parallel requests (e.g. Dashboard + Stats).
     # 2. Both fail with 401 (Expired).
-    # 3. Both trigger a Token Refresh simultaneously.
-    # 4. Refresh A succeeds -> Rotates User.JTI to "A".
-    # 5. Refresh B succeeds -> Rotates User.JTI to "B".
-    # 6. Request A retries with Token "A".
-    # 7. API rejects Token "A" because DB now has JTI "B". -> User Logged Out.
-    #
-    # By disabling this check for short-lived Access Tokens (15m), we allow
-    # "slightly stale" tokens to work until they expire naturally.
+    # 3. Both trigger a Token Refresh with the same refresh token (JTI "A").
+    # 4. Refresh 1 rotates User.JTI from "A" to next_refresh_jti("A") = "A'".
+    # 5. Refresh 2 finds User.JTI already "A'"; it is accepted only within
+    #    REFRESH_TOKEN_GRACE_SECONDS of the rotation, and gets the same "A'".
+    # 6. Both retries carry JTI "A'", matching the DB. -> User stays logged in.
     #
-    # Strict JTI validation IS STILL ENFORCED for Refresh Tokens in
-    # `refresh_token_handler` to prevent token theft/replay.
+    # Replaying "A" after the grace window (or after logout) is rejected.
     # -------------------------------------------------------------------------
 
     # token_jti = payload.get("jti")
     # if user.jti is None and token_jti is not None:
-    #     raise credentials_exception
+    #     raise _credentials_exception()
     # if user.jti is not None and token_jti != user.jti:
-    #     raise credentials_exception
-
-    # Check expiration (belt and suspenders - JWT library also checks this)
-    if payload.get("exp") and datetime.fromtimestamp(
-        payload["exp"], tz=timezone.utc
-    ) < datetime.now(timezone.utc):
-        raise credentials_exception
+    #     raise _credentials_exception()
 
+    # Expiration is enforced by jwt.decode in decode_jwt (ExpiredSignatureError)
     return user
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 import asyncpg
@@ -14,11 +15,17 @@ from api.core.logger import logger
 checkpointer = MemorySaver()
 
 
+@lru_cache(maxsize=1)
+def _get_agent_app(pool: asyncpg.Pool):
+    """Compile the agent graph once per pool: nodes hold no per-run state."""
+    return build_agent_graph(pool, checkpointer=checkpointer)
+
+
 async def start_recommendation_handler(
     playlist_id: int, pool: asyncpg.Pool
 ) -> Optional[Dict[str, Any]]:
     """Start the Hidden Gem Hunter agent from a playlist (v3 supervisor pattern)."""
-    app = build_agent_graph(pool, checkpointer=checkpointer)
+    app = _get_agent_app(pool)
 
     # Config for this thread
     thread_id = f"playlist_{playlist_id}"
@@ -47,19 +54,19 @@ async def start_recommendation_handler(
     }
 
     try:
-        logger.info(f"🚀 Starting agent for playlist {playlist_id}")
+        logger.info("🚀 Starting agent for playlist %s", playlist_id)
         final_state = await app.ainvoke(initial_state, config=config)
         # Return the full state wrapped in an object with ui_state
         return {"ui_state": final_state.get("ui_state")}
     except LLMFailureError as e:
-        logger.error(f"❌ LLM service unavailable: {e}")
+        logger.error("❌ LLM service unavailable: %s", e)
         return {
             "message": "Sorry, our AI service is currently unavailable. Please try again later.",
             "cards": [],
             "options": [],
         }
     except Exception as e:
-        logger.error(f"❌ Agent start failed: {e}", exc_info=True)
+        logger.error("❌ Agent start failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Agent start failed: {str(e)}")
 
 
@@ -71,31 +78,31 @@ async def resume_agent_handler(
     library_repo: LibraryRepository,
 ) -> Optional[Dict[str, Any]]:
     """Resume the agent with a user action (v3 supervisor pattern)."""
-    logger.info(f"🔵 Resume agent: action={action}, playlist_id={playlist_id}")
+    logger.info("🔵 Resume agent: action=%s, playlist_id=%s", action, playlist_id)
 
-    app = build_agent_graph(pool, checkpointer=checkpointer)
+    app = _get_agent_app(pool)
     thread_id = f"playlist_{playlist_id}"
     config = {"configurable": {"thread_id": thread_id}}
 
     # Handle Action
     if action == "add":
         track_id = payload.get("track_id")  # payload is a dict, not Pydantic
-        logger.info(f"➕ Action: add track {track_id} to playlist {playlist_id}")
+        logger.info("➕ Action: add track %s to playlist %s", track_id, playlist_id)
 
         try:
             await library_repo.add_track_to_playlist(playlist_id, track_id)
             logger.info(
-                f"✅ Successfully added track {track_id} to playlist {playlist_id}"
+                "✅ Successfully added track %s to playlist %s", track_id, playlist_id
             )
             return None  # Frontend handles UI update
         except Exception as e:
-            logger.error(f"Failed to add track: {e}")
+            logger.error("Failed to add track: %s", e)
             return None
 
     elif action == "set_vibe":
         # User selected vibe after analyze_playlist
         vibe = payload.get("vibe")  # payload is a dict, not Pydantic
-        logger.info(f"🎵 Action: set_vibe to {vibe}")
+        logger.info("🎵 Action: set_vibe to %s", vibe)
 
         await app.aupdate_state(config, {"vibe_choice": vibe})
 
@@ -104,7 +111,7 @@ async def resume_agent_handler(
         known_artists = payload.get(
             "known_artists", []
         )  # payload is a dict, not Pydantic
-        logger.info(f"✋ Action: submit_knowledge, known_artists={known_artists}")
+        logger.info("✋ Action: submit_knowledge, known_artists=%s", known_artists)
 
         # Handle special values
         if known_artists == ["none"]:
@@ -112,18 +119,17 @@ async def resume_agent_handler(
         elif known_artists == ["all"]:
             # Get all artists from candidates
             state = await app.aget_state(config)
-            candidates = state.values.get("candidate_tracks", [])
-            known_artists = list(
-                set(
-                    t.get("artist") if isinstance(t, dict) else t.artist
-                    for t in candidates[:20]
-                )
-            )
+            candidates = state.values.get("candidate_tracks", [])[:20]
+            # search_tracks writes one homogeneous list: check its type once
+            if candidates and isinstance(candidates[0], dict):
+                known_artists = list({t.get("artist") for t in candidates})
+            else:
+                known_artists = list({t.artist for t in candidates})
 
         await app.aupdate_state(config, {"known_artists": known_artists})
 
     else:
-        logger.warning(f"⚠️ Unknown action: {action}")
+        logger.warning("⚠️ Unknown action: %s", action)
         return None
 
     # Resume execution
@@ -133,12 +139,12 @@ async def resume_agent_handler(
         # Return the full state wrapped in an object with ui_state
         return {"ui_state": final_state.get("ui_state")}
     except LLMFailureError as e:
-        logger.error(f"❌ LLM service unavailable: {e}")
+        logger.error("❌ LLM service unavailable: %s", e)
         return {
             "message": "Sorry, our AI service is currently unavailable. Please try again later.",
             "cards": [],
             "options": [],
         }
     except Exception as e:
-        logger.error(f"❌ Graph execution failed: {e}", exc_info=True)
+        logger.error("❌ Graph execution failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Agent execution failed: {str(e)}")
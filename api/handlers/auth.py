@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+from datetime import datetime, timezone
 from secrets import token_urlsafe
 from uuid import uuid4
 
@@ -13,16 +14,33 @@ from api.core.exceptions import (
 )
 from api.core.logger import logger
 from api.core.security import (
+    REFRESH_TOKEN_EXPIRE,
     create_access_token,
     create_refresh_token,
     decode_jwt,
     get_password_hash,
-    verify_password,
+    next_refresh_jti,
+    verify_user_password,
 )
 from api.models.auth import RefreshTokenPayload, Token, UserCreate
 from api.models.responses import SuccessResponse
 from api.repositories.auth import AuthRepository
 
+_REFRESH_TTL_S = int(REFRESH_TOKEN_EXPIRE.total_seconds())
+
+
+def _set_refresh_cookie(response: Response, refresh_token: str) -> None:
+    """Attach the refresh token as an HttpOnly cross-site cookie."""
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        httponly=True,
+        secure=True,
+        samesite="none",
+        expires=_REFRESH_TTL_S,
+        max_age=_REFRESH_TTL_S,
+    )
+
 
 async def register_user_handler(
     user_create: UserCreate,
@@ -32,7 +50,8 @@ async def register_user_handler(
     if existing_user:
         raise AlreadyExistsException("Email")
 
-    hashed_password = get_password_hash(user_create.password)
+    # bcrypt is CPU-bound by design: keep it off the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, user_create.password)
     await auth_repo.create_user(
         email=user_create.email,
         username=user_create.username,
@@ -48,35 +67,26 @@ async def login_handler(
     response: Response,
 ) -> Token:
     user = await auth_repo.get_user_by_email(form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    password_ok = await asyncio.to_thread(
+        verify_user_password,
+        form_data.password,
+        user.hashed_password if user else None,
+    )
+    if not user or not password_ok:
         logger.warning(f"Failed login attempt for: {form_data.username}")
         raise UnauthorizedException("Incorrect email or password")
     if not user.is_active:
         raise InactiveUserException()
 
-    jti_uuid = str(uuid4())
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email, "jti": jti_uuid}, expires_delta=access_token_expires
-    )
-    refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    refresh_token = create_refresh_token(
-        data={"sub": user.email, "jti": jti_uuid}, expires_delta=refresh_token_expires
-    )
+    jti_uuid = token_urlsafe(16)
+    access_token = create_access_token(data={"sub": user.email, "jti": jti_uuid})
+    refresh_token = create_refresh_token(data={"sub": user.email, "jti": jti_uuid})
 
     await auth_repo.update_user_jti(
-        user.id, jti_uuid, datetime.now(timezone.utc) + refresh_token_expires
+        user.id, jti_uuid, datetime.now(timezone.utc) + REFRESH_TOKEN_EXPIRE
     )
 
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=True,
-        samesite="none",
-        expires=int(refresh_token_expires.total_seconds()),
-        max_age=int(refresh_token_expires.total_seconds()),
-    )
+    _set_refresh_cookie(response, refresh_token)
     return Token(access_token=access_token, token_type="bearer")
 
 
@@ -91,44 +101,28 @@ async def guest_login_handler(
     guest_email = f"guest_{random_suffix}@demo.msv2"
     guest_password = token_urlsafe(16)
 
-    hashed_password = get_password_hash(guest_password)
+    hashed_password = await asyncio.to_thread(get_password_hash, guest_password)
 
-    # Create the user in DB
+    # 2. Generate tokens up front, so the user row is created with its JTI
+    # This logic mimics login_handler exactly
+    jti_uuid = token_urlsafe(16)
+    access_token = create_access_token(data={"sub": guest_email, "jti": jti_uuid})
+    refresh_token = create_refresh_token(data={"sub": guest_email, "jti": jti_uuid})
+
+    # 3. Create the user in DB (single INSERT, no follow-up JTI update)
     user = await auth_repo.create_user(
         email=guest_email,
         username=f"Guest {random_suffix}",
         hashed_password=hashed_password,
+        jti=jti_uuid,
+        jti_expires_at=datetime.now(timezone.utc) + REFRESH_TOKEN_EXPIRE,
     )
     logger.info(f"Created guest user: {guest_email}")
 
-    # 2. Perform Login (Generation of Tokens)
-    # This logic mimics login_handler exactly
     if not user.is_active:
         raise InactiveUserException()  # Should not happen for new users, but safety first
 
-    jti_uuid = str(uuid4())
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email, "jti": jti_uuid}, expires_delta=access_token_expires
-    )
-    refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    refresh_token = create_refresh_token(
-        data={"sub": user.email, "jti": jti_uuid}, expires_delta=refresh_token_expires
-    )
-
-    await auth_repo.update_user_jti(
-        user.id, jti_uuid, datetime.now(timezone.utc) + refresh_token_expires
-    )
-
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=True,
-        samesite="none",
-        expires=int(refresh_token_expires.total_seconds()),
-        max_age=int(refresh_token_expires.total_seconds()),
-    )
+    _set_refresh_cookie(response, refresh_token)
     return Token(access_token=access_token, token_type="bearer")
 
 
@@ -150,42 +144,31 @@ async def refresh_token_handler(
     except Exception:
         raise UnauthorizedException("Invalid refresh token payload")
 
-    user = await auth_repo.get_user_by_email(refresh_token_payload.sub)
-    if (
-        not user
-        or user.jti != refresh_token_payload.jti
-        or user.jti_expires_at < datetime.now(timezone.utc)
-    ):
+    # Validate and rotate in one atomic UPDATE. The successor JTI is derived from
+    # the old one, so a parallel refresh with the same token lands on the same JTI
+    # (accepted for a short grace window) instead of logging the other tab out
+    new_jti_uuid = next_refresh_jti(refresh_token_payload.jti)
+    user = await auth_repo.rotate_jti(
+        refresh_token_payload.sub,
+        refresh_token_payload.jti,
+        new_jti_uuid,
+        datetime.now(timezone.utc) + REFRESH_TOKEN_EXPIRE,
+        settings.REFRESH_TOKEN_GRACE_SECONDS,
+    )
+    if not user:
         logger.warning(
             f"Invalid refresh token attempt for: {refresh_token_payload.sub}"
         )
         raise UnauthorizedException("Invalid or expired refresh token")
 
-    new_jti_uuid = str(uuid4())
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     new_access_token = create_access_token(
-        data={"sub": user.email, "jti": new_jti_uuid},
-        expires_delta=access_token_expires,
+        data={"sub": user.email, "jti": new_jti_uuid}
     )
-    new_refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     new_refresh_token = create_refresh_token(
-        data={"sub": user.email, "jti": new_jti_uuid},
-        expires_delta=new_refresh_token_expires,
-    )
-
-    await auth_repo.update_user_jti(
-        user.id, new_jti_uuid, datetime.now(timezone.utc) + new_refresh_token_expires
+        data={"sub": user.email, "jti": new_jti_uuid}
     )
 
-    response.set_cookie(
-        key="refresh_token",
-        value=new_refresh_token,
-        httponly=True,
-        secure=True,
-        samesite="none",
-        expires=int(new_refresh_token_expires.total_seconds()),
-        max_age=int(new_refresh_token_expires.total_seconds()),
-    )
+    _set_refresh_cookie(response, new_refresh_token)
     return Token(access_token=new_access_token, token_type="bearer")
 
 
@@ -1,3 +1,7 @@
+import asyncio
+
+from pydantic import TypeAdapter
+
 from api.core.exceptions import APIException, NotFoundException
 from api.core.logger import logger
 from api.models.coordinates import (
@@ -11,6 +15,9 @@ from api.models.coordinates import (
 )
 from api.repositories.coordinates import CoordinatesRepository
 
+# Validates a whole list of rows in one pydantic-core call instead of one model per row
+_POINT_LIST = TypeAdapter(list[Point])
+
 
 async def get_all_points_handler(
     coords_repo: CoordinatesRepository,
@@ -19,9 +26,12 @@ async def get_all_points_handler(
     viz_type: VisualizationType = VisualizationType.DEFAULT,
 ) -> PointsResponse:
     """Get paginated coordinate points."""
-    points_data = await coords_repo.get_all_points(limit, offset, viz_type)
-    total = await coords_repo.count_points(viz_type)
-    points = [Point(**point) for point in points_data]
+    # Independent queries: run them on two pool connections at once
+    points_data, total = await asyncio.gather(
+        coords_repo.get_all_points(limit, offset, viz_type),
+        coords_repo.count_points(viz_type),
+    )
+    points = _POINT_LIST.validate_python(points_data)
 
     return PointsResponse(
         points=points,
@@ -71,7 +81,7 @@ async def search_tracks_handler(
         raise APIException("Search query must be at least 2 characters")
 
     results = await coords_repo.search_tracks(query, limit, viz_type)
-    return [Point(**point) for point in results]
+    return _POINT_LIST.validate_python(results)
 
 
 async def get_cluster_handler(
@@ -84,7 +94,7 @@ async def get_cluster_handler(
     if not cluster_data:
         raise NotFoundException("Cluster", str(cluster_id))
 
-    tracks = [Point(**track) for track in cluster_data["tracks"]]
+    tracks = _POINT_LIST.validate_python(cluster_data["tracks"])
 
     return ClusterInfo(
         cluster_id=cluster_data["cluster_id"],
@@ -105,7 +115,7 @@ async def get_track_neighbors_handler(
     if neighbors_data is None:
         raise NotFoundException("Track in coordinate space", str(track_id))
 
-    neighbors = [Point(**point) for point in neighbors_data]
+    neighbors = _POINT_LIST.validate_python(neighbors_data)
     logger.debug(f"Found {len(neighbors)} neighbors for track {track_id}")
 
     return TrackNeighbors(track_id=track_id, neighbors=neighbors)
@@ -1,7 +1,9 @@
+import hashlib
 from typing import List, Tuple
 
 import numpy as np
 
+from api.core.caches import text_embedding_cache
 from api.core.config import settings
 from api.core.exceptions import NotFoundException
 from api.models.discovery import (
@@ -12,7 +14,7 @@ from api.models.discovery import (
 )
 from api.repositories.inference import InferenceRepository
 from api.repositories.library import LibraryRepository
-from api.repositories.discovery import DiscoveryRepository
+from api.repositories.discovery import STEERING_AXES, DiscoveryRepository
 from api.models.library import Track
 
 
@@ -45,8 +47,11 @@ async def discovery_search_handler(
     2. Vector Search (Candidates)
     3. Python-side Artist Diversity Filtering
     """
-    # 1. Get Text Embedding
-    embedding_resp = await inference_repo.get_text_embedding(query)
+    # 1. Get Text Embedding (cached; concurrent identical queries share one call)
+    query_key = hashlib.blake2b(query.encode(), digest_size=16).digest()
+    embedding_resp = await text_embedding_cache.get_or_load(
+        query_key, lambda: inference_repo.get_text_embedding(query)
+    )
 
     # 2. Get Candidates (Top 40)
     candidates = await library_repo.search_semantic_by_vector(
@@ -74,45 +79,21 @@ async def discovery_refine_handler(
     """
     Handle latent space refinement using centroids as steering vectors.
     """
-    # 1. Fetch Centroids
-    centroids = await discovery_repo.get_all_centroids()
-
-    # 2. Vector Math: Apply steering to base vector
-    base = np.array(request.base_vector)
-    zero = np.zeros(512)
-
-    # Get centroids with zero-vector fallback
-    c_electronic = np.array(centroids.get("electronic", zero))
-    c_acoustic = np.array(centroids.get("acoustic", zero))
-    c_hiphop = np.array(centroids.get("hiphop", zero))
-    c_ambient = np.array(centroids.get("ambient", zero))
-    c_global = np.array(centroids.get("global", zero))
-    c_reggae = np.array(centroids.get("reggae", zero))
-
-    # Steer
-    refined = base.copy()
-
-    # Axis 1: Digital vs. Organic
-    if request.digital_organic != 0:
-        refined += (c_electronic - c_acoustic) * request.digital_organic
+    # 1. Fetch steering axes (centroid differences, cached by the repository)
+    axes = await discovery_repo.get_steering_axes()
 
-    # Axis 2: Energy
-    if request.energy != 0:
-        refined += (c_hiphop - c_ambient) * request.energy
-
-    # Axis 3: Urban Identity
-    if request.urban != 0:
-        refined += (c_hiphop - c_global) * request.urban
-
-    # Axis 4: Bass Culture
-    if request.bass != 0:
-        refined += (c_reggae - c_global) * request.bass
+    # 2. Vector Math: one weighted sum of all axes (zero weights contribute nothing)
+    weights = np.array(
+        [getattr(request, axis) for axis in STEERING_AXES], dtype=np.float32
+    )
+    refined = np.asarray(request.base_vector, dtype=np.float32) + weights @ axes
 
     # 3. Perform search with refined vector
-    refined_list = refined.tolist()
+    # The vector codec encodes the float32 array directly; only the response needs a list
     candidates = await library_repo.search_semantic_by_vector(
-        refined_list, limit=settings.SIMILAR_TRACKS_LIMIT
+        refined, limit=settings.SIMILAR_TRACKS_LIMIT
     )
+    refined_list = refined.tolist()
 
     if not candidates:
         # Should be unlikely with a valid base vector, but possible
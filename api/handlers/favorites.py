@@ -1,3 +1,5 @@
+import asyncio
+
 from api.core.config import settings
 from api.core.exceptions import MaxLimitException, NotFoundException
 from api.models.library import FavoritesList
@@ -8,12 +10,17 @@ from api.repositories.favorites import FavoritesRepository
 async def add_favorite_handler(
     user_id: int, track_id: int, favorites_repo: FavoritesRepository
 ) -> OperationResult:
+    # Both checks are independent: run them concurrently
+    exists, count = await asyncio.gather(
+        favorites_repo.track_exists(track_id),
+        favorites_repo.get_favorites_count(user_id),
+    )
+
     # Check if track exists
-    if not await favorites_repo.track_exists(track_id):
+    if not exists:
         raise NotFoundException("Track", str(track_id))
 
     # Check limit
-    count = await favorites_repo.get_favorites_count(user_id)
     if count >= settings.MAX_FAVORITES_PER_USER:
         raise MaxLimitException("favorites", settings.MAX_FAVORITES_PER_USER)
 
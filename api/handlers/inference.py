@@ -1,17 +1,32 @@
 import asyncio
+import random
+from typing import Optional
 
 import httpx
 
+from api.core.config import settings
 from api.core.exceptions import APIException
 from api.core.logger import logger
 from api.models.inference import EmbeddingResponse
 from api.repositories.inference import InferenceRepository
 
 
+def _retry_delay(attempt: int, deadline: float) -> Optional[float]:
+    """
+    Full-jitter backoff (uniform in [0, 2**attempt] seconds), so concurrent callers
+    don't retry in lockstep. Returns None when no time would be left for another
+    attempt before the deadline.
+    """
+    remaining = deadline - asyncio.get_running_loop().time()
+    wait = random.uniform(0, 2**attempt)
+    return wait if wait < remaining else None
+
+
 async def get_embeddings_handler(
     audio_minio_path: str,
     inference_repo: InferenceRepository,
     max_retries: int = 3,
+    retry_budget: Optional[float] = None,
 ) -> EmbeddingResponse:
     """
     Get embeddings for an audio file from inference service.
@@ -21,6 +36,8 @@ async def get_embeddings_handler(
         audio_minio_path: Path to audio file in MinIO bucket
         inference_repo: Inference repository instance
         max_retries: Maximum number of retry attempts (default: 3)
+        retry_budget: Total seconds for all attempts and backoff
+            (default: settings.INFERENCE_RETRY_BUDGET)
 
     Returns:
         EmbeddingResponse with embeddings vector
@@ -30,6 +47,12 @@ async def get_embeddings_handler(
     """
     logger.info(f"Requesting embeddings for: {audio_minio_path}")
 
+    # Overall budget: attempts are cut to what is left of it, and no retry starts
+    # once it is spent
+    loop = asyncio.get_running_loop()
+    if retry_budget is None:
+        retry_budget = settings.INFERENCE_RETRY_BUDGET
+    deadline = loop.time() + retry_budget
     last_exception = None
 
     for attempt in range(max_retries):
@@ -39,7 +62,10 @@ async def get_embeddings_handler(
                     f"Retry attempt {attempt + 1}/{max_retries} for {audio_minio_path}"
                 )
 
-            result = await inference_repo.get_embeddings(audio_minio_path)
+            timeout = min(inference_repo.timeout, deadline - loop.time())
+            result = await inference_repo.get_embeddings(
+                audio_minio_path, timeout=timeout
+            )
             logger.info(
                 f"Successfully got embeddings for {audio_minio_path}: shape {result.shape}"
             )
@@ -47,17 +73,19 @@ async def get_embeddings_handler(
 
         except httpx.TimeoutException as e:
             last_exception = e
-            if attempt < max_retries - 1:
-                wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
+            wait_time = (
+                _retry_delay(attempt, deadline) if attempt < max_retries - 1 else None
+            )
+            if wait_time is not None:
                 logger.warning(
                     f"Inference service timeout (attempt {attempt + 1}/{max_retries}). "
-                    f"Retrying in {wait_time}s... This may be a cold start."
+                    f"Retrying in {wait_time:.1f}s... This may be a cold start."
                 )
                 await asyncio.sleep(wait_time)
             else:
-                logger.error(f"Inference service timeout after {max_retries} attempts")
+                logger.error(f"Inference service timeout after {attempt + 1} attempts")
                 raise APIException(
-                    detail=f"Inference service timeout after {max_retries} attempts. "
+                    detail=f"Inference service timeout after {attempt + 1} attempts. "
                     f"The service may be experiencing cold start issues.",
                     status_code=503,
                 ) from e
@@ -79,16 +107,18 @@ async def get_embeddings_handler(
 
         except httpx.RequestError as e:
             last_exception = e
-            if attempt < max_retries - 1:
-                wait_time = 2**attempt
+            wait_time = (
+                _retry_delay(attempt, deadline) if attempt < max_retries - 1 else None
+            )
+            if wait_time is not None:
                 logger.warning(
                     f"Failed to reach inference service (attempt {attempt + 1}/{max_retries}). "
-                    f"Retrying in {wait_time}s..."
+                    f"Retrying in {wait_time:.1f}s..."
                 )
                 await asyncio.sleep(wait_time)
             else:
                 logger.error(
-                    f"Failed to reach inference service after {max_retries} attempts"
+                    f"Failed to reach inference service after {attempt + 1} attempts"
                 )
                 raise APIException(
                     detail=f"Failed to reach inference service: {str(e)}",
@@ -1,3 +1,5 @@
+import asyncio
+
 from api.core.config import settings
 from api.core.exceptions import NotFoundException
 from api.core.logger import logger
@@ -37,8 +39,9 @@ async def get_track_by_id_handler(
 async def get_artist_list_handler(
     library_repo: LibraryRepository, limit: int, offset: int
 ) -> ArtistList:
-    artists = await library_repo.get_artist_list(limit, offset)
-    total = await library_repo.get_artist_count()
+    artists, total = await asyncio.gather(
+        library_repo.get_artist_list(limit, offset), library_repo.get_artist_count()
+    )
     if not artists:
         raise NotFoundException("Artists")
     return ArtistList(artists=artists, total=total)
@@ -79,9 +82,16 @@ async def get_tracklist_from_artist_and_album_handler(
 async def get_similar_tracks_handler(
     track_id: int, library_repo: LibraryRepository
 ) -> SimilarTrackList:
-    # Get the original track to exclude its artist from recommendations
-    original_track = await library_repo.get_track_by_id(
-        track_id, include_embeddings=False
+    # The original track (for the 404) and the candidates are independent queries.
+    # Artist diversity (max 1 track per artist, never the original's artist, filled
+    # up with duplicates if needed) is applied in SQL over the nearest candidates
+    original_track, similar_tracks = await asyncio.gather(
+        library_repo.get_cached_track(track_id),
+        library_repo.get_diverse_similar_tracks(
+            track_id,
+            candidates=settings.SIMILAR_TRACKS_LIMIT,
+            limit=settings.SIMILAR_TRACKS_RETURNED,
+        ),
     )
     if not original_track:
         logger.warning(
@@ -89,11 +99,6 @@ async def get_similar_tracks_handler(
         )
         raise NotFoundException("Track", str(track_id))
 
-    # Query for candidates to allow for artist diversity filtering
-    similar_tracks = await library_repo.get_similar_tracks(
-        track_id, limit=settings.SIMILAR_TRACKS_LIMIT
-    )
-
     if not similar_tracks:
         logger.warning(f"No similar tracks found for track: {track_id}")
         raise NotFoundException("Similar tracks", str(track_id))
@@ -102,27 +107,10 @@ async def get_similar_tracks_handler(
         f"Found {len(similar_tracks)} similar tracks for '{original_track.title}' by {original_track.artist}"
     )
 
-    # Apply artist diversity filter (max 1 track per artist)
-    seen_artists = {original_track.artist} if original_track.artist else set()
-    filtered_tracks = []
-    fallback_tracks = []
-
-    for track, distance in similar_tracks:
-        similar_track = SimilarTrack(track=track, similarity_score=distance)
-
-        if track.artist not in seen_artists:
-            filtered_tracks.append(similar_track)
-            seen_artists.add(track.artist)
-        else:
-            fallback_tracks.append(similar_track)
-
-        if len(filtered_tracks) == settings.SIMILAR_TRACKS_RETURNED:
-            break
-
-    # Fill remainder with duplicate artists if needed
-    if len(filtered_tracks) < settings.SIMILAR_TRACKS_RETURNED:
-        filtered_tracks.extend(
-            fallback_tracks[: settings.SIMILAR_TRACKS_RETURNED - len(filtered_tracks)]
-        )
-
-    return SimilarTrackList(tracks=filtered_tracks)
+    # Tracks come validated from the repository and distances are floats already
+    return SimilarTrackList.model_construct(
+        tracks=[
+            SimilarTrack.model_construct(track=track, similarity_score=distance)
+            for track, distance in similar_tracks
+        ]
+    )
@@ -1,7 +1,10 @@
+import asyncio
+
 from fastapi import Request
 from fastapi.responses import StreamingResponse
 from minio.error import S3Error
 
+from api.core.caches import audio_size_cache
 from api.core.config import settings
 from api.core.exceptions import APIException, NotFoundException
 from api.core.logger import logger
@@ -16,7 +19,7 @@ async def stream_audio_handler(
     media_repo: MediaRepository,
 ):
     # Get track from database
-    track = await library_repo.get_track_by_id(track_id, include_embeddings=False)
+    track = await library_repo.get_cached_track(track_id)
     if not track:
         raise NotFoundException("Track", str(track_id))
 
@@ -24,8 +27,14 @@ async def stream_audio_handler(
         raise APIException("Track has no file path")
 
     try:
-        # Get file size from bucket
-        file_size = media_repo.get_object_size_in_bytes(track.relative_path)
+        # Get file size from bucket (cached: seeking players send many Range requests)
+        # The MinIO client is blocking: keep its round-trips off the event loop
+        file_size = await audio_size_cache.get_or_load(
+            track.relative_path,
+            lambda: asyncio.to_thread(
+                media_repo.get_object_size_in_bytes, track.relative_path
+            ),
+        )
 
         # Check for Range header (for seeking/partial content)
         range_header = request.headers.get("range")
@@ -39,8 +48,11 @@ async def stream_audio_handler(
             content_length = end - start + 1
 
             # Get partial object
-            response = media_repo.get_object_stream(
-                track.relative_path, offset=start, length=content_length
+            response = await asyncio.to_thread(
+                media_repo.get_object_stream,
+                track.relative_path,
+                offset=start,
+                length=content_length,
             )
 
             logger.debug(f"Streaming track {track_id} (range: {start}-{end})")
@@ -57,7 +69,9 @@ async def stream_audio_handler(
             )
         else:
             # Full file request
-            response = media_repo.get_object_stream(track.relative_path)
+            response = await asyncio.to_thread(
+                media_repo.get_object_stream, track.relative_path
+            )
 
             logger.debug(f"Streaming full track {track_id}")
             return StreamingResponse(
@@ -23,7 +23,8 @@ class UserInDB(UserBase):
     jti: Optional[str] = None
     jti_expires_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    # Frozen: cached instances are shared across requests
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class User(UserBase):
@@ -39,10 +40,6 @@ class Token(BaseModel):
     token_type: str
 
 
-class TokenData(BaseModel):
-    sub: Optional[str] = None
-
-
 class RefreshTokenPayload(BaseModel):
     sub: str  # User email
     jti: str  # JWT ID
@@ -9,6 +9,29 @@ from api.models.auth import UserInDB
 from api.repositories.database import DatabaseClient, validate_table_name
 
 
+_USER_COLUMNS = (
+    "id, email, username, hashed_password, is_active, is_admin, "
+    "created_at, updated_at, jti, jti_expires_at"
+)
+
+
+def _row_to_user(row: asyncpg.Record) -> UserInDB:
+    """Build a UserInDB from a users row without re-validating trusted DB types."""
+    # Read the record directly instead of copying it into an intermediate dict
+    return UserInDB.model_construct(
+        id=row["id"],
+        email=row["email"],
+        username=row["username"],
+        hashed_password=row["hashed_password"],
+        is_active=row["is_active"],
+        is_admin=row["is_admin"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        jti=row["jti"],
+        jti_expires_at=row["jti_expires_at"],
+    )
+
+
 class AuthRepository:
     """Repository for user authentication and authorization operations."""
 
@@ -18,26 +41,31 @@ class AuthRepository:
         self.table = settings.AUTH_TABLE
 
     async def create_user(
-        self, email: str, username: Optional[str], hashed_password: str
+        self,
+        email: str,
+        username: Optional[str],
+        hashed_password: str,
+        jti: Optional[str] = None,
+        jti_expires_at: Optional[datetime] = None,
     ) -> UserInDB:
         query = f"""
-            INSERT INTO {self.table} (email, username, hashed_password)
-            VALUES ($1, $2, $3)
-            RETURNING id, email, username, hashed_password, is_active, 
-                      is_admin, created_at, updated_at, jti, jti_expires_at;
+            INSERT INTO {self.table} (email, username, hashed_password, jti, jti_expires_at)
+            VALUES ($1, $2, $3, $4, $5)
+            RETURNING {_USER_COLUMNS};
         """
-        row = await self.db.fetchrow(query, email, username, hashed_password)
+        row = await self.db.fetchrow(
+            query, email, username, hashed_password, jti, jti_expires_at
+        )
         # logger.info(f"User created: {email}")
-        return UserInDB(**dict(row))
+        return _row_to_user(row)
 
     async def get_user_by_email(self, email: str) -> Optional[UserInDB]:
         query = f"""
-            SELECT id, email, username, hashed_password, is_active, is_admin, 
-                   created_at, updated_at, jti, jti_expires_at 
+            SELECT {_USER_COLUMNS}
             FROM {self.table} WHERE email = $1;
         """
         row = await self.db.fetchrow(query, email)
-        return UserInDB(**dict(row)) if row else None
+        return _row_to_user(row) if row else None
 
     async def update_user_jti(
         self, user_id: int, jti: str, jti_expires_at: datetime
@@ -50,6 +78,37 @@ class AuthRepository:
         await self.db.execute(query, jti, jti_expires_at, user_id)
         logger.debug(f"Updated JTI for user {user_id}")
 
+    async def rotate_jti(
+        self,
+        email: str,
+        old_jti: str,
+        new_jti: str,
+        new_jti_expires_at: datetime,
+        grace_seconds: int = 0,
+    ) -> Optional[UserInDB]:
+        """
+        Swap the user's refresh JTI in one statement, only if `old_jti` is still the
+        current, unexpired one. A refresh racing one that already swapped in `new_jti`
+        is accepted (without touching the row again) for `grace_seconds` after it.
+        Returns None otherwise (stale or reused token).
+        """
+        query = f"""
+            UPDATE {self.table}
+            SET jti = $3,
+                jti_expires_at = CASE WHEN jti = $2 THEN $4 ELSE jti_expires_at END,
+                updated_at = CASE WHEN jti = $2 THEN NOW() ELSE updated_at END
+            WHERE email = $1
+              AND (
+                  (jti = $2 AND jti_expires_at > NOW())
+                  OR (jti = $3 AND updated_at > NOW() - make_interval(secs => $5))
+              )
+            RETURNING {_USER_COLUMNS};
+        """
+        row = await self.db.fetchrow(
+            query, email, old_jti, new_jti, new_jti_expires_at, float(grace_seconds)
+        )
+        return _row_to_user(row) if row else None
+
     async def clear_user_jti(self, user_id: int) -> None:
         query = f"""
             UPDATE {self.table} 
@@ -61,9 +120,8 @@ class AuthRepository:
 
     async def get_all_users(self) -> list[UserInDB]:
         query = f"""
-            SELECT id, email, username, hashed_password, is_active, is_admin, 
-                   created_at, updated_at, jti, jti_expires_at 
+            SELECT {_USER_COLUMNS}
             FROM {self.table};
         """
         rows = await self.db.fetch(query)
-        return [UserInDB(**dict(row)) for row in rows]
+        return [_row_to_user(row) for row in rows]
@@ -1,7 +1,9 @@
+import asyncio
 from typing import Dict, List, Optional
 
 import asyncpg
 
+from api.core.caches import TTLCache
 from api.core.config import settings
 from api.models.coordinates import VisualizationType
 from api.repositories.database import DatabaseClient, validate_table_name
@@ -19,6 +21,8 @@ class CoordinatesRepository:
         self.viz_table_umap = settings.TRACK_VIZ_TABLE_2
         self.viz_table_sphere = settings.TRACK_VIZ_TABLE_3
         self.music_table = settings.MUSIC_TABLE
+        # Viz tables are rebuilt offline: exact counts change rarely, scans are not free
+        self._count_cache = TTLCache(ttl=settings.COORDINATES_COUNT_CACHE_TTL)
 
     def _get_table(self, viz_type: VisualizationType) -> str:
         """Get the table name based on visualization type."""
@@ -51,8 +55,11 @@ class CoordinatesRepository:
     async def count_points(
         self, viz_type: VisualizationType = VisualizationType.DEFAULT
     ) -> int:
-        """Get total count of visualization points."""
+        """Get total count of visualization points (cached per table)."""
         table = self._get_table(viz_type)
+        return await self._count_cache.get_or_load(table, lambda: self._count(table))
+
+    async def _count(self, table: str) -> int:
         query = f"SELECT COUNT(*) FROM {table};"
         result = await self.db.fetchval(query)
         return result or 0
@@ -62,13 +69,11 @@ class CoordinatesRepository:
     ) -> Dict:
         """Get overall visualization statistics."""
         table = self._get_table(viz_type)
-        # Total tracks
-        total_query = f"SELECT COUNT(*) FROM {table};"
-        total = await self.db.fetchval(total_query)
-
-        # Total clusters
-        cluster_query = f"SELECT COUNT(DISTINCT cluster) FROM {table};"
-        cluster_count = await self.db.fetchval(cluster_query)
+        # Total tracks and clusters in one scan
+        totals_query = f"""
+            SELECT COUNT(*) AS total, COUNT(DISTINCT cluster) AS clusters
+            FROM {table};
+        """
 
         # Genre distribution (top 10)
         genre_query = f"""
@@ -80,7 +85,6 @@ class CoordinatesRepository:
             ORDER BY count DESC
             LIMIT 10;
         """
-        genre_rows = await self.db.fetch(genre_query)
 
         # Largest cluster
         largest_query = f"""
@@ -90,7 +94,15 @@ class CoordinatesRepository:
             ORDER BY size DESC
             LIMIT 1;
         """
-        largest = await self.db.fetchrow(largest_query)
+
+        # The three queries are independent: run them concurrently on the pool
+        totals, genre_rows, largest = await asyncio.gather(
+            self.db.fetchrow(totals_query),
+            self.db.fetch(genre_query),
+            self.db.fetchrow(largest_query),
+        )
+        total = totals["total"] if totals else 0
+        cluster_count = totals["clusters"] if totals else 0
 
         return {
             "total_tracks": total or 0,
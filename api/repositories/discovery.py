@@ -1,9 +1,23 @@
 from typing import Dict, List
 
 import asyncpg
+import numpy as np
 
+from api.core.caches import TTLCache
+from api.core.config import settings
+from api.core.db_codecs import decode_vector
 from api.repositories.database import DatabaseClient
 
+EMBEDDING_DIM = 512
+
+# Refinement axes: name -> (centroid pushed towards, centroid pushed away from)
+STEERING_AXES = {
+    "digital_organic": ("electronic", "acoustic"),
+    "energy": ("hiphop", "ambient"),
+    "urban": ("hiphop", "global"),
+    "bass": ("reggae", "global"),
+}
+
 
 class DiscoveryRepository:
     """Repository for discovery-related operations, like fetching centroids."""
@@ -11,18 +25,34 @@ class DiscoveryRepository:
     def __init__(self, pool: asyncpg.Pool):
         self.db = DatabaseClient(pool)
         self.table = "discovery_centroids"
+        # Centroids are recomputed offline, so the derived axes are kept per worker
+        self._axes_cache = TTLCache(ttl=settings.DISCOVERY_CENTROIDS_TTL, maxsize=1)
 
     async def get_all_centroids(self) -> Dict[str, List[float]]:
         """Fetch all calculated centroids into a dictionary for quick math."""
         query = f"SELECT name, embedding FROM {self.table};"
         rows = await self.db.fetch(query)
 
-        # Convert pgvector strings/lists into float lists
-        centroids = {}
-        for row in rows:
-            emb = row["embedding"]
-            if isinstance(emb, str):
-                emb = [float(x) for x in emb.strip("[]").split(",")]
-            centroids[row["name"]] = emb
-
-        return centroids
+        # The vector codec already decodes embeddings; decode_vector passes lists through
+        return {row["name"]: decode_vector(row["embedding"]) for row in rows}
+
+    async def get_steering_axes(self) -> np.ndarray:
+        """
+        Centroid difference vectors as a (len(STEERING_AXES), 512) float32 matrix,
+        one row per axis in STEERING_AXES order. Missing centroids count as zero vectors.
+        """
+        # Single-flight: concurrent cold requests share one centroid query
+        return await self._axes_cache.get_or_load("axes", self._build_steering_axes)
+
+    async def _build_steering_axes(self) -> np.ndarray:
+        centroids = await self.get_all_centroids()
+        zero = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+
+        def centroid(name: str) -> np.ndarray:
+            if name not in centroids:
+                return zero
+            return np.asarray(centroids[name], dtype=np.float32)
+
+        return np.stack(
+            [centroid(towards) - centroid(away) for towards, away in STEERING_AXES.values()]
+        )
@@ -59,8 +59,8 @@ class FavoritesRepository:
         """
         rows = await self.db.fetch(query, user_id)
         tracks = [Track(**dict(row)) for row in rows]
-        count = await self.get_favorites_count(user_id)
-        return tracks, count
+        # Every favorite is already in the result set, no second COUNT(*) round trip
+        return tracks, len(tracks)
 
     async def is_favorite(self, user_id: int, track_id: int) -> bool:
         """Check if a track is in user's favorites."""
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import httpx
 
 from api.core.config import settings
@@ -13,7 +15,8 @@ from api.models.inference import (
 class InferenceRepository:
     """Repository for inference service HTTP operations."""
 
-    def __init__(self, timeout: int = 600):
+    def __init__(self, client: httpx.AsyncClient, timeout: int = 600):
+        self.client = client
         self.timeout = timeout
         self.base_url = settings.MSV2_INFERENCE_URL
 
@@ -39,12 +42,15 @@ class InferenceRepository:
             raise RuntimeError("CLAP_INFERENCE_URL is not configured.")
         return f"{url.rstrip('/')}/embed"
 
-    async def get_embeddings(self, audio_minio_path: str) -> EmbeddingResponse:
+    async def get_embeddings(
+        self, audio_minio_path: str, timeout: Optional[float] = None
+    ) -> EmbeddingResponse:
         """
         Call inference service to get embeddings for audio file.
 
         Args:
             audio_minio_path: Path to audio file in MinIO bucket
+            timeout: Per-call timeout in seconds (defaults to the repository timeout)
 
         Returns:
             EmbeddingResponse with embeddings vector
@@ -58,41 +64,41 @@ class InferenceRepository:
 
         logger.debug(f"Calling inference service for: {audio_minio_path}")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                self.endpoint,
-                content=payload.model_dump_json(),
-                headers={"Content-Type": "application/json"},
-            )
+        response = await self.client.post(
+            self.endpoint,
+            content=payload.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout if timeout is None else timeout,
+        )
 
-            # Raise exception for error status codes
-            response.raise_for_status()
+        # Raise exception for error status codes
+        response.raise_for_status()
 
-            result = EmbeddingResponse(**response.json())
-            logger.debug(f"Received embeddings: shape {result.shape}")
-            return result
+        result = EmbeddingResponse.model_validate_json(response.content)
+        logger.debug(f"Received embeddings: shape {result.shape}")
+        return result
 
     async def letstest(self):
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                self.test,
-                headers={"Content-Type": "application/json"},
-            )
-            return {
-                "status_code": response.status_code,
-                "content": response.text,
-                "inference_url": self.test,
-            }
+        response = await self.client.get(
+            self.test,
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        return {
+            "status_code": response.status_code,
+            "content": response.text,
+            "inference_url": self.test,
+        }
 
     async def get_text_embedding(self, text: str) -> TextEmbeddingResponse:
         """Call CLAP inference service to get embedding for text."""
         payload = TextEmbeddingRequest(text=text)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                self.clap_endpoint,
-                content=payload.model_dump_json(),
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            return TextEmbeddingResponse(**response.json())
+        response = await self.client.post(
+            self.clap_endpoint,
+            content=payload.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return TextEmbeddingResponse.model_validate_json(response.content)
@@ -1,13 +1,22 @@
 from typing import Optional
 
 import asyncpg
+import numpy as np
 
+from api.core.caches import track_cache
 from api.core.config import settings
 from api.core.db_codecs import decode_vector, normalize_vector
 from api.core.logger import logger
 from api.models.library import Track, TrackList
 from api.repositories.database import DatabaseClient, validate_table_name
 
+# Track metadata columns (everything but the embedding), built once at import
+_TRACK_COLUMNS = (
+    "id, filename, filepath, relative_path, album_folder, artist_folder, "
+    "filesize, title, artist, album, year, tracknumber, genre, "
+    "top_5_genres, created_at"
+)
+
 
 class LibraryRepository:
     """Repository for lirary / megaset db operations."""
@@ -19,11 +28,7 @@ class LibraryRepository:
 
     def _get_columns(self, include_embeddings: bool = False) -> str:
         """Get column list based on whether embeddings are needed."""
-        if include_embeddings:
-            return "*"
-        return """id, filename, filepath, relative_path, album_folder, artist_folder, 
-                  filesize, title, artist, album, year, tracknumber, genre, 
-                  top_5_genres, created_at"""
+        return "*" if include_embeddings else _TRACK_COLUMNS
 
     async def count_tracks(self) -> int:
         query = f"SELECT COUNT(*) FROM {self.table};"
@@ -34,7 +39,17 @@ class LibraryRepository:
         self, include_embeddings: bool = False
     ) -> Optional[Track]:
         columns = self._get_columns(include_embeddings)
-        query = f"SELECT {columns} FROM {self.table} ORDER BY RANDOM() LIMIT 1;"
+        # Probe a random point in the id range and take the next row through the
+        # primary key index, instead of sorting the whole table with ORDER BY RANDOM()
+        query = f"""
+            SELECT {columns} FROM {self.table}
+            WHERE id >= (
+                SELECT FLOOR(RANDOM() * (MAX(id) - MIN(id) + 1))::bigint + MIN(id)
+                FROM {self.table}
+            )
+            ORDER BY id
+            LIMIT 1;
+        """
         row = await self.db.fetchrow(query)
         return Track(**dict(row)) if row else None
 
@@ -46,6 +61,17 @@ class LibraryRepository:
         row = await self.db.fetchrow(query, track_id)
         return Track(**dict(row)) if row else None
 
+    async def get_cached_track(self, track_id: int) -> Optional[Track]:
+        """
+        Metadata-only get_track_by_id through the per-worker track cache, for internal
+        lookups that only read identity fields (artist, title, paths).
+        Entries may lag metadata updates by up to TRACK_CACHE_TTL seconds, since
+        other workers' caches are not invalidated; missing tracks are not cached.
+        """
+        return await track_cache.get_or_load(
+            track_id, lambda: self.get_track_by_id(track_id, include_embeddings=False)
+        )
+
     async def get_artist_list(self, limit: int, offset: int) -> list[str]:
         """Get paginated list of artists."""
         query = f"SELECT DISTINCT artist_folder FROM {self.table} ORDER BY artist_folder LIMIT $1 OFFSET $2;"
@@ -70,8 +96,8 @@ class LibraryRepository:
         columns = self._get_columns(include_embeddings)
         query = f"SELECT {columns} FROM {self.table} WHERE album_folder = $1 ORDER BY tracknumber;"
         rows = await self.db.fetch(query, album_name)
-        tracks = [Track(**dict(row)) for row in rows]
-        return TrackList(tracks=tracks)
+        # Validate the whole list in one pass instead of one Track(**row) call per row
+        return TrackList.model_validate({"tracks": [dict(row) for row in rows]})
 
     async def get_tracklist_from_artist_and_album(
         self, artist_name: str, album_name: str, include_embeddings: bool = False
@@ -79,45 +105,68 @@ class LibraryRepository:
         columns = self._get_columns(include_embeddings)
         query = f"SELECT {columns} FROM {self.table} WHERE artist_folder = $1 AND album = $2;"
         rows = await self.db.fetch(query, artist_name, album_name)
-        tracks = [Track(**dict(row)) for row in rows]
-        return TrackList(tracks=tracks)
+        # Validate the whole list in one pass instead of one Track(**row) call per row
+        return TrackList.model_validate({"tracks": [dict(row) for row in rows]})
 
-    async def get_similar_tracks(
-        self, track_id: int, limit: int
+    async def get_diverse_similar_tracks(
+        self, track_id: int, candidates: int, limit: int
     ) -> list[tuple[Track, float]]:
         """
-        Get similar tracks using pgvector cosine distance.
-        Optimized to use HNSW index for 16k+ song library.
+        Get similar tracks using pgvector cosine distance, with artist diversity
+        applied in SQL. Optimized to use HNSW index for 16k+ song library.
 
-        Args:
-            track_id: ID of the track to find similar tracks for
-            limit: Number of similar tracks to return
+        Takes the `candidates` nearest tracks, then returns up to `limit` of them:
+        first the closest track of each artist (skipping the original track's artist),
+        then, if that is not enough, the remaining candidates. Both groups are
+        ordered by distance.
 
         Returns:
             List of tuples: (track, distance_score)
         """
-        # Optimized query: Use subquery instead of CTE to allow HNSW index usage
+        # Nearest neighbours use a subquery instead of a CTE to allow HNSW index usage;
+        # the ranking then only touches those few candidate rows.
+        # An original track without artist ('' or NULL) excludes nobody.
         query = f"""
-            SELECT 
-                id, filename, filepath, relative_path, album_folder, 
-                artist_folder, filesize, title, artist, album, 
-                year, tracknumber, genre, top_5_genres, created_at,
-                (embedding_512_vector <=> (
-                    SELECT embedding_512_vector 
-                    FROM {self.table} 
-                    WHERE id = $1
-                )) as distance
-            FROM {self.table}
-            WHERE id != $1 
-                AND embedding_512_vector IS NOT NULL
-            ORDER BY embedding_512_vector <=> (
-                SELECT embedding_512_vector 
-                FROM {self.table} 
-                WHERE id = $1
+            WITH ranked AS (
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER (PARTITION BY artist ORDER BY distance) AS artist_rank
+                FROM (
+                    SELECT 
+                        {_TRACK_COLUMNS},
+                        (embedding_512_vector <=> (
+                            SELECT embedding_512_vector 
+                            FROM {self.table} 
+                            WHERE id = $1
+                        )) as distance
+                    FROM {self.table}
+                    WHERE id != $1 
+                        AND embedding_512_vector IS NOT NULL
+                    ORDER BY embedding_512_vector <=> (
+                        SELECT embedding_512_vector 
+                        FROM {self.table} 
+                        WHERE id = $1
+                    )
+                    LIMIT $2
+                ) candidates
+            ),
+            original AS (
+                SELECT NULLIF(artist, '') AS artist FROM {self.table} WHERE id = $1
             )
-            LIMIT $2;
+            SELECT {_TRACK_COLUMNS}, distance
+            FROM ranked
+            ORDER BY
+                (
+                    artist_rank = 1
+                    AND (
+                        (SELECT artist FROM original) IS NULL
+                        OR artist IS DISTINCT FROM (SELECT artist FROM original)
+                    )
+                ) DESC,
+                distance
+            LIMIT $3;
         """
-        rows = await self.db.fetch(query, track_id, limit)
+        rows = await self.db.fetch(query, track_id, candidates, limit)
         results = []
         for row in rows:
             row_dict = dict(row)
@@ -224,9 +273,7 @@ class LibraryRepository:
         # Optimized query: Don't select embedding, use ORDER BY with vector operator
         query = f"""
             SELECT 
-                id, filename, filepath, relative_path, album_folder, artist_folder, 
-                filesize, title, artist, album, year, tracknumber, genre, 
-                top_5_genres, created_at,
+                {_TRACK_COLUMNS},
                 (embedding_512_vector <=> $1) as distance
             FROM {self.table}
             WHERE embedding_512_vector IS NOT NULL
@@ -285,6 +332,7 @@ class LibraryRepository:
             WHERE id = $1;
         """
         await self.db.execute(query, *values)
+        track_cache.pop(track_id)  # This worker only; others catch up within the TTL
         return True
 
     async def search_hidden_gems_with_filters(
@@ -309,9 +357,7 @@ class LibraryRepository:
         # 3. Apply filters as post-processing to leverage vector index first
         query = f"""
             SELECT 
-                id, filename, filepath, relative_path, album_folder, artist_folder, 
-                filesize, title, artist, album, year, tracknumber, genre, 
-                top_5_genres, created_at, bpm, energy, brightness, harmonic_ratio, 
+                {_TRACK_COLUMNS}, bpm, energy, brightness, harmonic_ratio, 
                 estimated_key,
                 (embedding_512_vector <=> $1) as distance
             FROM {self.table}
@@ -349,10 +395,11 @@ class LibraryRepository:
         return tracks
 
     async def search_semantic_by_vector(
-        self, vector: list[float], limit: int = 40
+        self, vector: list[float] | np.ndarray, limit: int = 40
     ) -> list[tuple[Track, float]]:
         """
         Perform semantic search using CLAP embeddings.
+        Accepts a list or a numpy array (passed straight to the vector codec).
         Returns a pool of candidates sorted by similarity.
         """
         query = f"""
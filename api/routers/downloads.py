@@ -47,7 +47,7 @@ async def download_database(
         filename = path.split("/")[-1]
         
         return StreamingResponse(
-            response.stream(32*1024),  # 32KB chunks
+            response.stream(settings.AUDIO_STREAM_CHUNK_SIZE),
             media_type="application/octet-stream",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -6,11 +6,51 @@ import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 
 from api.main import app
-from api.core.dependencies import get_db_pool, get_minio_client, get_auth_repository
+from api.core.caches import user_cache
+from api.core.dependencies import (
+    get_auth_repository,
+    get_coordinates_repository,
+    get_db_pool,
+    get_discovery_repository,
+    get_favorites_repository,
+    get_inference_repository,
+    get_library_repository,
+    get_media_repository,
+    get_minio_client,
+    get_playlists_repository,
+)
 from api.repositories.auth import AuthRepository
+from api.repositories.coordinates import CoordinatesRepository
+from api.repositories.discovery import DiscoveryRepository
+from api.repositories.favorites import FavoritesRepository
+from api.repositories.inference import InferenceRepository
+from api.repositories.library import LibraryRepository
+from api.repositories.media import MediaRepository
+from api.repositories.playlists import PlaylistsRepository
+
+# Repositories live on app.state (built in the lifespan, which tests don't run),
+# so every repository dependency is overridden with a mock
+REPOSITORY_DEPENDENCIES = {
+    get_auth_repository: AuthRepository,
+    get_library_repository: LibraryRepository,
+    get_favorites_repository: FavoritesRepository,
+    get_playlists_repository: PlaylistsRepository,
+    get_coordinates_repository: CoordinatesRepository,
+    get_discovery_repository: DiscoveryRepository,
+    get_media_repository: MediaRepository,
+    get_inference_repository: InferenceRepository,
+}
 
 
-# Mock MinIO
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    # Authenticated users are cached per email; don't leak them across tests
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+# Mock MinIO (health check)
 @pytest.fixture
 def mock_minio_client():
     mock = MagicMock()
@@ -24,7 +64,7 @@ def override_minio(mock_minio_client):
     app.dependency_overrides.pop(get_minio_client, None)
 
 
-# Mock AsyncPG Pool
+# Mock AsyncPG Pool (health check and agent routes)
 @pytest.fixture
 def mock_db_pool():
     pool = MagicMock()  # acquire is not async, it returns a context manager
@@ -47,16 +87,36 @@ def override_db_pool(mock_db_pool):
 
 
 @pytest.fixture
-def mock_auth_repo():
-    repo = AsyncMock(spec=AuthRepository)
-    return repo
+def mock_repos() -> dict:
+    """One AsyncMock per repository class (sync methods stay plain mocks)."""
+    return {
+        repo_class: AsyncMock(spec=repo_class)
+        for repo_class in REPOSITORY_DEPENDENCIES.values()
+    }
+
+
+def _provide(repo):
+    # A bare closure: FastAPI would read a default argument as a query parameter
+    return lambda: repo
 
 
 @pytest.fixture(autouse=True)
-def override_auth_repo(mock_auth_repo):
-    app.dependency_overrides[get_auth_repository] = lambda: mock_auth_repo
+def override_repositories(mock_repos):
+    for dependency, repo_class in REPOSITORY_DEPENDENCIES.items():
+        app.dependency_overrides[dependency] = _provide(mock_repos[repo_class])
     yield
-    app.dependency_overrides.pop(get_auth_repository, None)
+    for dependency in REPOSITORY_DEPENDENCIES:
+        app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture
+def mock_auth_repo(mock_repos):
+    return mock_repos[AuthRepository]
+
+
+@pytest.fixture
+def mock_library_repo(mock_repos):
+    return mock_repos[LibraryRepository]
 
 
 @pytest_asyncio.fixture
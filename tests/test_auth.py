@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock
 
@@ -78,3 +80,169 @@ async def test_login_success(async_client: AsyncClient, mock_auth_repo):
 
     # Verify cookies
     assert "refresh_token" in response.cookies
+
+
+@pytest.mark.asyncio
+async def test_guest_login_creates_user_with_jti(
+    async_client: AsyncClient, mock_auth_repo
+):
+    mock_user = MagicMock()
+    mock_user.is_active = True
+    mock_auth_repo.create_user.return_value = mock_user
+
+    response = await async_client.post("/auth/guest")
+
+    assert response.status_code == 200
+    assert "access_token" in response.json()
+    assert "refresh_token" in response.cookies
+
+    # The JTI is written by the INSERT itself, no follow-up UPDATE
+    assert mock_auth_repo.create_user.call_args.kwargs["jti"]
+    mock_auth_repo.update_user_jti.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_login_unknown_email(
+    async_client: AsyncClient, mock_auth_repo, monkeypatch
+):
+    from api.core import security
+
+    verify_password = MagicMock(wraps=security.verify_password)
+    monkeypatch.setattr(security, "verify_password", verify_password)
+    mock_auth_repo.get_user_by_email.return_value = None
+
+    form_data = {"username": "nobody@example.com", "password": "whatever123"}
+
+    response = await async_client.post("/auth/login", data=form_data)
+
+    assert response.status_code == 401
+    assert "refresh_token" not in response.cookies
+    # bcrypt still runs, against the dummy hash, so timing doesn't reveal the email
+    verify_password.assert_called_once_with(
+        "whatever123", security._DUMMY_PASSWORD_HASH
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_jti(async_client: AsyncClient, mock_auth_repo):
+    from api.core.security import create_refresh_token
+
+    mock_user = MagicMock()
+    mock_user.email = "test@example.com"
+    mock_auth_repo.rotate_jti.return_value = mock_user
+
+    token = create_refresh_token({"sub": "test@example.com", "jti": "old-jti"})
+    response = await async_client.post(
+        "/auth/refresh", headers={"Cookie": f"refresh_token={token}"}
+    )
+
+    assert response.status_code == 200
+    assert "access_token" in response.json()
+    email, old_jti, new_jti, _, _ = mock_auth_repo.rotate_jti.call_args.args
+    assert (email, old_jti) == ("test@example.com", "old-jti")
+    assert new_jti != old_jti
+
+
+@pytest.mark.asyncio
+async def test_parallel_refreshes_agree_on_jti(
+    async_client: AsyncClient, mock_auth_repo
+):
+    from api.core.security import create_refresh_token, decode_jwt
+
+    mock_user = MagicMock()
+    mock_user.email = "test@example.com"
+    mock_auth_repo.rotate_jti.return_value = mock_user
+
+    token = create_refresh_token({"sub": "test@example.com", "jti": "old-jti"})
+    responses = await asyncio.gather(
+        *(
+            async_client.post(
+                "/auth/refresh", headers={"Cookie": f"refresh_token={token}"}
+            )
+            for _ in range(2)
+        )
+    )
+
+    assert [r.status_code for r in responses] == [200, 200]
+    # Both rotations target the same successor, so the loser hits the grace window
+    new_jtis = {call.args[2] for call in mock_auth_repo.rotate_jti.call_args_list}
+    assert len(new_jtis) == 1
+    access_jtis = {decode_jwt(r.json()["access_token"])["jti"] for r in responses}
+    assert access_jtis == new_jtis
+
+
+@pytest.mark.asyncio
+async def test_refresh_rejects_stale_jti(async_client: AsyncClient, mock_auth_repo):
+    from api.core.security import create_refresh_token
+
+    mock_auth_repo.rotate_jti.return_value = None  # JTI already rotated or expired
+
+    token = create_refresh_token({"sub": "test@example.com", "jti": "old-jti"})
+    response = await async_client.post(
+        "/auth/refresh", headers={"Cookie": f"refresh_token={token}"}
+    )
+
+    assert response.status_code == 401
+
+
+def _user_in_db(email: str = "test@example.com"):
+    from datetime import datetime, timezone
+
+    from api.models.auth import UserInDB
+
+    now = datetime.now(timezone.utc)
+    return UserInDB(
+        id=1,
+        email=email,
+        username="testuser",
+        hashed_password="hash",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _auth_headers(email: str = "test@example.com") -> dict:
+    from api.core.security import create_access_token
+
+    token = create_access_token({"sub": email, "jti": "some-jti"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_authenticated_user_is_cached(async_client: AsyncClient, mock_auth_repo):
+    mock_auth_repo.get_user_by_email.return_value = _user_in_db()
+
+    for _ in range(2):
+        response = await async_client.get("/auth/me", headers=_auth_headers())
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+
+    mock_auth_repo.get_user_by_email.assert_called_once_with("test@example.com")
+
+
+@pytest.mark.asyncio
+async def test_user_cache_disabled_with_zero_ttl(
+    async_client: AsyncClient, mock_auth_repo, monkeypatch
+):
+    from api.core.caches import TTLCache
+
+    monkeypatch.setattr("api.core.security.user_cache", TTLCache(ttl=0))
+    mock_auth_repo.get_user_by_email.return_value = _user_in_db()
+
+    for _ in range(2):
+        response = await async_client.get("/auth/me", headers=_auth_headers())
+        assert response.status_code == 200
+
+    assert mock_auth_repo.get_user_by_email.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_is_rejected(async_client: AsyncClient, mock_auth_repo):
+    mock_auth_repo.get_user_by_email.return_value = None
+
+    response = await async_client.get(
+        "/auth/me", headers=_auth_headers("ghost@example.com")
+    )
+
+    assert response.status_code == 401
+    mock_auth_repo.get_user_by_email.assert_called_once_with("ghost@example.com")
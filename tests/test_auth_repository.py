@@ -0,0 +1,83 @@
+"""
+Repository tests against a real Postgres.
+Set TEST_DATABASE_URL to run them; they are skipped otherwise.
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+from api.core.security import next_refresh_jti
+from api.repositories.auth import AuthRepository
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+TABLE = "test_users"
+EMAIL = "test@example.com"
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+)
+
+
+@pytest_asyncio.fixture
+async def auth_repo():
+    pool = await asyncpg.create_pool(TEST_DATABASE_URL, min_size=1, max_size=2)
+    await pool.execute(f"""
+        DROP TABLE IF EXISTS {TABLE};
+        CREATE TABLE {TABLE} (
+            id serial PRIMARY KEY,
+            email text UNIQUE NOT NULL,
+            username text,
+            hashed_password text NOT NULL,
+            is_active boolean NOT NULL DEFAULT TRUE,
+            is_admin boolean NOT NULL DEFAULT FALSE,
+            created_at timestamptz NOT NULL DEFAULT NOW(),
+            updated_at timestamptz NOT NULL DEFAULT NOW(),
+            jti text,
+            jti_expires_at timestamptz
+        );
+    """)
+    repo = AuthRepository(pool)
+    repo.table = TABLE
+    try:
+        await repo.create_user(EMAIL, None, "hash", "old-jti", _expiry())
+        yield repo
+    finally:
+        await pool.execute(f"DROP TABLE IF EXISTS {TABLE};")
+        await pool.close()
+
+
+def _expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=7)
+
+
+async def test_parallel_refreshes_both_rotate(auth_repo):
+    new_jti = next_refresh_jti("old-jti")
+
+    users = await asyncio.gather(
+        *(
+            auth_repo.rotate_jti(EMAIL, "old-jti", new_jti, _expiry(), 10)
+            for _ in range(2)
+        )
+    )
+
+    assert [user.jti for user in users] == [new_jti, new_jti]
+
+
+async def test_replay_outside_grace_window_is_rejected(auth_repo):
+    new_jti = next_refresh_jti("old-jti")
+
+    assert await auth_repo.rotate_jti(EMAIL, "old-jti", new_jti, _expiry(), 0)
+    assert await auth_repo.rotate_jti(EMAIL, "old-jti", new_jti, _expiry(), 0) is None
+
+
+async def test_unknown_jti_is_rejected(auth_repo):
+    new_jti = next_refresh_jti("forged-jti")
+
+    user = await auth_repo.rotate_jti(EMAIL, "forged-jti", new_jti, _expiry(), 10)
+
+    assert user is None
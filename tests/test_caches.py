@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from api.core.caches import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_single_flight():
+    cache = TTLCache(ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "embedding"
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("query", loader) for _ in range(5))
+    )
+
+    assert results == ["embedding"] * 5
+    assert calls == 1
+    # Later callers are served from the cache
+    assert await cache.get_or_load("query", loader) == "embedding"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_does_not_cache_errors():
+    cache = TTLCache(ttl=60)
+
+    async def failing():
+        raise RuntimeError("inference down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("query", failing)
+
+    async def loader():
+        return "embedding"
+
+    assert await cache.get_or_load("query", loader) == "embedding"
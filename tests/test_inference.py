@@ -0,0 +1,51 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from api.core.exceptions import APIException
+from api.handlers import inference as inference_handlers
+from api.handlers.inference import get_embeddings_handler
+
+
+@pytest.fixture
+def inference_repo():
+    repo = MagicMock()
+    repo.timeout = 360
+    repo.get_embeddings = AsyncMock()
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_a_jittered_delay(inference_repo, monkeypatch):
+    delays = []
+
+    def fake_uniform(low, high):
+        delays.append((low, high))
+        return 0.0
+
+    monkeypatch.setattr(inference_handlers.random, "uniform", fake_uniform)
+    result = MagicMock(shape=[1, 512])
+    inference_repo.get_embeddings.side_effect = [httpx.ConnectError("cold"), result]
+
+    assert await get_embeddings_handler("a.mp3", inference_repo) is result
+    # Full jitter: the first retry waits somewhere in [0, 1]s
+    assert delays == [(0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_budget_is_spent(inference_repo):
+    async def slow_timeout(path, timeout):
+        await asyncio.sleep(0.05)
+        raise httpx.ReadTimeout("cold start")
+
+    inference_repo.get_embeddings.side_effect = slow_timeout
+
+    with pytest.raises(APIException) as exc_info:
+        await get_embeddings_handler("a.mp3", inference_repo, retry_budget=0.05)
+
+    assert exc_info.value.status_code == 503
+    # The first attempt used up the budget: no retry, and it was capped to the budget
+    assert inference_repo.get_embeddings.await_count == 1
+    assert inference_repo.get_embeddings.call_args.kwargs["timeout"] <= 0.05
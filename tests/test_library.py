@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from api.core.dependencies import get_current_user
+from api.main import app
+from api.models.library import Track
+
+
+@pytest.fixture
+def authenticated():
+    app.dependency_overrides[get_current_user] = lambda: None
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.mark.asyncio
+async def test_get_track_by_id(
+    async_client: AsyncClient, mock_library_repo, authenticated
+):
+    mock_library_repo.get_track_by_id.return_value = Track(
+        id=42,
+        filename="song.mp3",
+        filepath="/music/song.mp3",
+        relative_path="artist/album/song.mp3",
+        artist="Artist",
+        genre="Dub",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+    response = await async_client.get("/library/track/42")
+
+    assert response.status_code == 200
+    assert response.json()["genre"] == "Dub"
+    # The public endpoint reads the database, not the internal track cache
+    mock_library_repo.get_track_by_id.assert_awaited_once_with(42, False)
+    mock_library_repo.get_cached_track.assert_not_called()
@@ -0,0 +1,112 @@
+"""
+Repository tests against a real Postgres with pgvector.
+Set TEST_DATABASE_URL to run them; they are skipped otherwise.
+"""
+
+import math
+import os
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+from api.core.db_codecs import register_vector_codec
+from api.repositories.library import LibraryRepository
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+TABLE = "test_similar_tracks"
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set (needs pgvector)"
+)
+
+
+@pytest_asyncio.fixture
+async def library_repo():
+    pool = await asyncpg.create_pool(
+        TEST_DATABASE_URL, init=register_vector_codec, min_size=1, max_size=2
+    )
+    await pool.execute(f"""
+        DROP TABLE IF EXISTS {TABLE};
+        CREATE TABLE {TABLE} (
+            id integer PRIMARY KEY,
+            filename text NOT NULL,
+            filepath text NOT NULL,
+            relative_path text NOT NULL,
+            album_folder text,
+            artist_folder text,
+            filesize double precision,
+            title text,
+            artist text,
+            album text,
+            year integer,
+            tracknumber integer,
+            genre text,
+            top_5_genres text,
+            created_at timestamptz NOT NULL DEFAULT NOW(),
+            embedding_512_vector vector(2)
+        );
+    """)
+    repo = LibraryRepository(pool)
+    repo.table = TABLE
+    try:
+        yield repo
+    finally:
+        await pool.execute(f"DROP TABLE IF EXISTS {TABLE};")
+        await pool.close()
+
+
+async def _insert_tracks(repo: LibraryRepository, tracks: list[tuple]):
+    """Insert (id, artist, angle) rows; cosine distance to angle 0 grows with angle."""
+    await repo.db.pool.executemany(
+        f"""
+        INSERT INTO {TABLE} (id, filename, filepath, relative_path, title, artist,
+                             embedding_512_vector)
+        VALUES ($1, 'f.mp3', 'p/f.mp3', 'p/f.mp3', $2, $2, $3);
+        """,
+        [
+            (track_id, artist, [math.cos(angle), math.sin(angle)])
+            for track_id, artist, angle in tracks
+        ],
+    )
+
+
+async def test_diverse_similar_tracks_ordering(library_repo):
+    await _insert_tracks(
+        library_repo,
+        [
+            (1, "A", 0.0),  # original track
+            (2, "A", 0.1),
+            (3, "B", 0.2),
+            (4, "B", 0.3),
+            (5, "C", 0.4),
+            (6, "A", 0.5),
+            (7, "D", 0.6),
+        ],
+    )
+
+    results = await library_repo.get_diverse_similar_tracks(1, candidates=6, limit=4)
+
+    # One track per new artist by distance, then the closest remaining candidate
+    assert [track.id for track, _ in results] == [3, 5, 7, 2]
+    assert [d for _, d in results][:3] == sorted(d for _, d in results[:3])
+
+
+@pytest.mark.parametrize("original_artist", [None, ""])
+async def test_diverse_similar_tracks_without_original_artist(
+    library_repo, original_artist
+):
+    await _insert_tracks(
+        library_repo,
+        [
+            (1, original_artist, 0.0),  # original track
+            (2, None, 0.1),
+            (3, "B", 0.2),
+            (4, None, 0.3),
+        ],
+    )
+
+    results = await library_repo.get_diverse_similar_tracks(1, candidates=3, limit=3)
+
+    # No artist to exclude: the first artist-less candidate stays in the diverse group
+    assert [track.id for track, _ in results] == [2, 3, 4]
@@ -0,0 +1,34 @@
+import logging.config
+
+from uvicorn.config import LOGGING_CONFIG
+
+from api.core import logger as logger_module
+
+
+def test_app_logs_reach_the_queue():
+    # dictConfig rewires the uvicorn loggers process-wide; restore them afterwards
+    uvicorn_loggers = [logging.getLogger(name) for name in LOGGING_CONFIG["loggers"]]
+    saved = [
+        (log, log.handlers[:], log.level, log.propagate, log.disabled)
+        for log in uvicorn_loggers
+    ]
+    try:
+        # What `uvicorn api.main:app` applies at startup
+        logging.config.dictConfig(LOGGING_CONFIG)
+
+        # Pause the background writer so the record stays in the queue
+        logger_module._listener.stop()
+        try:
+            logger_module.logger.info("queued record")
+            record = logger_module._log_queue.get_nowait()
+        finally:
+            logger_module._listener.start()
+    finally:
+        for log, handlers, level, propagate, disabled in saved:
+            log.handlers[:] = handlers
+            log.setLevel(level)
+            log.propagate = propagate
+            log.disabled = disabled
+
+    assert record.getMessage() == "queued record"
+    assert record.name == "api"
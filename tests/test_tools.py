@@ -182,6 +182,8 @@ async def test_present_results_with_unknown_artists(tools):
     cards = result["ui_state"]["cards"]
     # Should prioritize unknown artists
     assert cards[0]["artist"] == "Unknown Artist"
+    # Known artists only top up the selection, without repeating tracks
+    assert [c["id"] for c in cards] == ["2", "3", "1"]
 
 
 @pytest.mark.asyncio